@@ -24,25 +24,22 @@ Run with: streamlit run dashboard.py
 """
 
 
-import pandas as pd
 import streamlit as st
 
 import data
-from data import load_fire_data, load_landslide_data, load_flood_data, load_roads, load_counties
+from data import load_fire_data, load_landslide_data, load_flood_data, load_roads, load_counties, filter_by_year, map_year_range
 from plots import (
-    plot_bubble_map,
-    plot_dot_map,
-    plot_uncertainty_map_layers,
+    render_bubble_map,
+    render_dot_map,
+    render_uncertainty_map,
     plot_fire_by_county,
     plot_least_fire_by_county,
     plot_fires_by_year,
     plot_landslides_by_year,
     plot_floods_by_year,
     plot_flood_elevation_distribution,
-    classify,
-    fire_uncertainty,
-    landslide_uncertainty,
-    flood_uncertainty
+    annotate_counties,
+    show_figure
 )
 
 
@@ -77,11 +74,6 @@ if not data_loaded:
 
 tab0, tab1, tab2, tab3, tab4, tab5 = st.tabs(["Overview", "Maps", "Uncertainty Map", "Fire Data", "Landslide Data", "Flood Data"])
 
-
-fire_gdf = load_fire_data()
-landslide_gdf = load_landslide_data()
-flood_gdf = load_flood_data()
-
 # =============================================================================
 # TAB 0: OVERVIEW
 # =============================================================================
@@ -199,18 +191,11 @@ with tab0:
 # incidents across Oregon. Users can toggle between bubble maps (sized by
 # incident severity) and dot maps (showing individual locations), filter by
 # year range, and overlay roads and county boundaries for spatial context.
+# Runs as a fragment so its widgets rerun only this tab.
 # =============================================================================
 
-with tab1:
-
-    fire_gdf["PreparedDate"] = pd.to_datetime(
-        fire_gdf["PreparedDate"],
-        format="%m/%d/%Y %I:%M:%S %p",
-        errors="coerce"
-    )
-
-    fire_years = fire_gdf["PreparedDate"].dt.year.dropna().astype(int)
-
+@st.fragment
+def render_maps_tab():
 
     st.header("Oregon Fire, Landslide, & Flood Map")
 
@@ -240,62 +225,51 @@ with tab1:
 
     col1, col2 = st.columns([0.05, 1])
     with col1:
-        view_toggle = st.toggle("", label_visibility="collapsed", key="map_toggle")
+        view_toggle = st.toggle("Bubble map view", label_visibility="collapsed", key="tab1_map_toggle")
     with col2:
         st.markdown(f"#### {'Bubble Map, click to toggle to Dot Map' if view_toggle else 'Dot Map, click to toggle to Bubble Map'}")
 
 
-    fire_gdf["Year"] = fire_gdf["PreparedDate"].dt.year
-    landslide_years = pd.to_numeric(landslide_gdf["YEAR"], errors="coerce").dropna().astype(int)
-    flood_years = pd.to_datetime(flood_gdf["EFF_DATE"], errors="coerce").dt.year.dropna().astype(int)
-
-    combined_years = sorted(set(fire_years.tolist() + landslide_years.tolist() + flood_years.tolist()))
-
-    filtered_years = [year for year in combined_years if year >= 1960]
-
-    min_year = min(filtered_years)
-    max_year = max(filtered_years)
-    selected_range = st.slider("Select a year range", min_value=min_year, max_value=max_year, value=(min_year, max_year))
+    min_year, max_year = map_year_range(fire_gdf, landslide_gdf, flood_gdf)
+    selected_range = st.slider("Select a year range", min_value=min_year, max_value=max_year, value=(min_year, max_year), key="tab1_year_range")
 
     start_year, end_year = selected_range
 
 
-    fire_gdf_year = fire_gdf[
-        (fire_gdf["Year"] >= start_year) & (fire_gdf["Year"] <= end_year)
-    ]
+    fire_gdf_year = filter_by_year(fire_gdf, start_year, end_year)
 
 
 
-    landslide_gdf["YEAR"] = pd.to_numeric(landslide_gdf["YEAR"], errors="coerce")
-    landslide_gdf_year = landslide_gdf[(landslide_gdf["YEAR"] >= start_year) & (landslide_gdf["YEAR"] <= end_year)]
+    landslide_gdf_year = filter_by_year(landslide_gdf, start_year, end_year, column="YEAR")
 
 
-    flood_gdf["EFF_DATE"] = pd.to_datetime(flood_gdf["EFF_DATE"], errors="coerce")
-    flood_gdf["Year"] = flood_gdf["EFF_DATE"].dt.year
-    flood_gdf_year = flood_gdf[(flood_gdf["Year"] >= start_year) & (flood_gdf["Year"] <= end_year)]
+    flood_gdf_year = filter_by_year(flood_gdf, start_year, end_year)
 
 
     if view_toggle:
-        show_fire_bubbles = st.checkbox("Fires", value=True)
-        show_landslide_bubbles = st.checkbox("Landslides", value=True)
-        st.pyplot(plot_bubble_map(fire_gdf_year, landslide_gdf_year, show_fire_bubbles, show_landslide_bubbles))
+        show_fire_bubbles = st.checkbox("Fires", value=True, key="tab1_bubble_fires")
+        show_landslide_bubbles = st.checkbox("Landslides", value=True, key="tab1_bubble_landslides")
+        st.image(render_bubble_map(fire_gdf_year, landslide_gdf_year, start_year, end_year,
+                                   show_fire_bubbles, show_landslide_bubbles))
     else:
-        show_roads = st.checkbox("Roads", value=True)
-        show_counties = st.checkbox("Counties", value=True)
-        show_fires = st.checkbox("Fires", value=True)
-        show_landslides = st.checkbox("Landslides", value=True)
-        show_floods = st.checkbox("Flood Zones", value=True)
+        show_roads = st.checkbox("Roads", value=True, key="tab1_show_roads")
+        show_counties = st.checkbox("Counties", value=True, key="tab1_show_counties")
+        show_fires = st.checkbox("Fires", value=True, key="tab1_show_fires")
+        show_landslides = st.checkbox("Landslides", value=True, key="tab1_show_landslides")
+        show_floods = st.checkbox("Flood Zones", value=True, key="tab1_show_floods")
 
         roads_gdf = load_roads() if show_roads else None
         counties_gdf = load_counties() if show_counties else None
         flood_data = flood_gdf_year if show_floods else None
 
-        st.pyplot(plot_dot_map(
+        st.image(render_dot_map(
             fire_gdf_year,
             landslide_gdf_year,
-            flood_gdf=flood_data,
-            roads_gdf=roads_gdf,
-            counties_gdf=counties_gdf,
+            flood_data,
+            roads_gdf,
+            counties_gdf,
+            start_year,
+            end_year,
             show_fires=show_fires,
             show_landslides=show_landslides,
             show_floods=show_floods,
@@ -303,6 +277,10 @@ with tab1:
             show_counties=show_counties
         ))
 
+
+with tab1:
+    render_maps_tab()
+
 # =============================================================================
 # TAB 2: UNCERTAINTY MAP
 # =============================================================================
@@ -312,9 +290,11 @@ with tab1:
 # - Landslide uncertainty: relationship between slope and landslide occurrence
 # - Flood uncertainty: relationship between elevation and flood occurrence
 # Also includes a causal factor network diagram.
+# Runs as a fragment so its radio button reruns only this tab.
 # =============================================================================
 
-with tab2:
+@st.fragment
+def render_uncertainty_tab():
 
     st.header("Uncertainty Map")
     st.markdown("""
@@ -341,7 +321,8 @@ with tab2:
     uncertainty_option = st.radio(
         "Select Uncertainty Factor to Display:",
         options=["None", "Fire Uncertainty", "Landslide Uncertainty", "Flood Uncertainty"],
-        index=0  # Default to "None"
+        index=0,  # Default to "None"
+        key="tab2_uncertainty_option"
     )
 
     # Set flags based on selection
@@ -350,14 +331,21 @@ with tab2:
     show_flood = (uncertainty_option == "Flood Uncertainty")
 
     roads_gdf = load_roads() if show_roads else None
+    # Only classify the layer that is actually displayed
+    uncertainty_columns = tuple(
+        column for column, shown in (
+            ("Fire_Uncertainty", show_fire),
+            ("Landslide_Uncertainty", show_landslide),
+            ("Flood_Uncertainty", show_flood),
+        ) if shown
+    )
     counties_gdf = load_counties()
-    counties_gdf["Fire_Uncertainty"] = counties_gdf["COUNTY_NAM"].apply(lambda x: classify(x, fire_uncertainty))
-    counties_gdf["Landslide_Uncertainty"] = counties_gdf["COUNTY_NAM"].apply(lambda x: classify(x, landslide_uncertainty))
-    counties_gdf["Flood_Uncertainty"] = counties_gdf["COUNTY_NAM"].apply(lambda x: classify(x, flood_uncertainty))
+    if uncertainty_columns:
+        counties_gdf = annotate_counties(counties_gdf, uncertainty_columns)
 
-    st.pyplot(plot_uncertainty_map_layers(
+    st.image(render_uncertainty_map(
         counties_gdf,
-        roads_gdf=roads_gdf,
+        roads_gdf,
         show_roads=show_roads,
         show_counties=show_counties,
         show_fire=show_fire,
@@ -369,6 +357,10 @@ with tab2:
     st.image("photo/reasonnet.png")
 
 
+with tab2:
+    render_uncertainty_tab()
+
+
 # =============================================================================
 # TAB 3: FIRE DATA ANALYSIS
 # =============================================================================
@@ -390,7 +382,7 @@ with tab3:
     plot_least_fire_by_county(fire_gdf)
 
     st.subheader("Fires Per Year")
-    st.pyplot(plot_fires_by_year(fire_gdf))
+    show_figure(plot_fires_by_year(fire_gdf))
 
 # =============================================================================
 # TAB 4: LANDSLIDE DATA ANALYSIS
@@ -404,7 +396,7 @@ with tab4:
 
     st.header("Landslide Data Visualizations")
     st.subheader("Landslides Per Year")
-    st.pyplot(plot_landslides_by_year(landslide_gdf))
+    show_figure(plot_landslides_by_year(landslide_gdf))
 
 # =============================================================================
 # TAB 5: FLOOD DATA ANALYSIS
@@ -419,8 +411,8 @@ with tab5:
     st.header("Flood Data Visualizations")
 
     st.subheader("Flood Elevation Distribution")
-    st.pyplot(plot_flood_elevation_distribution(flood_gdf))
+    show_figure(plot_flood_elevation_distribution(flood_gdf))
     st.subheader("Floods per Year")
-    st.pyplot(plot_floods_by_year(flood_gdf))
+    show_figure(plot_floods_by_year(flood_gdf))
 
 
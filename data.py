@@ -16,14 +16,23 @@ Key Components:
   * Landslide data (geodatabase)
   * Flood hazard zones (geodatabase)
 
-All spatial data is reprojected to EPSG:4326 (WGS84) for consistency.
+All spatial data is reprojected to EPSG:4326 (WGS84) for consistency. Each
+source is converted to (Geo)Parquet under PARQUET_CACHE_DIR on first load
+(vector layers already reprojected) and read from that columnar copy until the
+source file changes.
 """
 
 
+import logging
+import os
+
+import numpy as np
 import pandas as pd
 import geopandas as gpd
+import shapely
 import streamlit as st
-from shapely.geometry import Point
+
+logger = logging.getLogger(__name__)
 
 
 PAGE_TITLE = "Oregon Fire, Flood & Landslide Dashboard"
@@ -37,6 +46,55 @@ LANDSLIDE_MIN_YEAR = 1965
 LANDSLIDE_EXCLUDE_YEAR = 1996
 LANDSLIDE_MIN_VOLUME_FT3 = 1000
 LANDSLIDE_MAX_VOLUME_FT3 = 1_000_000
+MAP_MIN_YEAR = 1960
+FLOOD_ELEVATION_BINS = 30
+
+# Pre-rendered map PNGs written by precompute_maps.py
+MAP_SNAPSHOT_DIR = "cache/maps"
+
+# Map extent (min lon, min lat, max lon, max lat) and dot map thinning grid
+OREGON_BOUNDS = (-125.0, 41.9, -116.4, 46.3)
+DOT_MAP_GRID_DECIMALS = 2
+# Most points drawn per map layer; larger layers are randomly subsampled
+MAP_MAX_POINTS = 50_000
+# Matplotlib line rendering: merge vertices that deviate less than this many
+# pixels, and hand Agg long paths in chunks of this many vertices
+PATH_SIMPLIFY_THRESHOLD = 1.0
+AGG_PATH_CHUNKSIZE = 10_000
+
+# Date formats
+FIRE_DATE_FORMAT = "%m/%d/%Y %I:%M:%S %p"
+
+# Attribute columns read from each source (geometry is always read)
+FIRE_COLUMNS = ["Longitude", "Latitude", "PreparedDate", "County", "FinalFireSizeAcres"]
+LANDSLIDE_COLUMNS = ["YEAR", "VOLUME_ft3"]
+FLOOD_COLUMNS = ["EFF_DATE", "ELEV"]
+COUNTY_COLUMNS = ["COUNTY_NAM", "ORIG_FID"]
+ROAD_COLUMNS = []
+
+# Years fit in 16 bits; the nullable dtype keeps records with a missing year
+YEAR_DTYPE = "Int16"
+# Fire county codes run 1-36; sizes, volumes and elevations do not need
+# double precision
+COUNTY_CODE_DTYPE = "Int8"
+MEASURE_DTYPE = "float32"
+
+# Incident data files
+FIRE_PATH = "data/ODF_Fire_3681693300358663469.csv"
+LANDSLIDE_PATH = "data/SLIDO_Release_4p5_wMetadata.gdb"
+FLOOD_PATH = "data/Oregon_Statewide_Flood_Hazards.gdb"
+
+# Base layer files (simplified copies are written by simplify_geometries.py)
+ROADS_PATH = "data/tl_2019_41_prisecroads"
+ROADS_SIMPLIFIED_PATH = "data/roads_simplified.shp"
+COUNTIES_PATH = "data/BLM_OR_County_Boundaries_Polygon_Hub_-3504410327477223647"
+COUNTIES_SIMPLIFIED_PATH = "data/counties_simplified.shp"
+SIMPLIFY_TOLERANCE_DEG = 0.001
+COORDINATE_GRID_SIZE_DEG = 1e-5
+
+# Columnar copies of the source files, written on first load
+PARQUET_CACHE_DIR = "cache/parquet"
+PARQUET_COMPRESSION = "zstd"
 
 
 FIRE_COLOR = "firebrick"
@@ -61,6 +119,7 @@ COUNTY_NUMBER_TO_NAME = {
             26: "Multnomah", 27: "Polk", 28: "Sherman", 29: "Tillamook", 30: "Umatilla",
             31: "Union", 32: "Wallowa", 33: "Wasco", 34: "Washington", 35: "Wheeler", 36: "Yamhill"
         }
+COUNTY_NAMES = list(COUNTY_NUMBER_TO_NAME.values())
 
 
 # =============================================================================
@@ -68,35 +127,263 @@ COUNTY_NUMBER_TO_NAME = {
 # =============================================================================
 
 
-@st.cache_data
+def _parquet_path(name):
+    return os.path.join(PARQUET_CACHE_DIR, f"{name}.parquet")
+
+
+def source_mtime(path):
+    """
+        Latest modification time of a source file or directory.
+
+        Shapefile folders and geodatabases are directories whose own mtime does
+        not change when a contained file is rewritten, so their entries are
+        checked too. A missing source counts as infinitely old so an existing
+        parquet copy or map snapshot keeps being used.
+
+        Args:
+            path (str): Source file or directory
+
+        Returns:
+            float: Modification time in seconds since the epoch, 0.0 if missing
+        """
+    if not os.path.exists(path):
+        return 0.0
+    mtime = os.path.getmtime(path)
+    if os.path.isdir(path):
+        for root, _, files in os.walk(path):
+            for file in files:
+                mtime = max(mtime, os.path.getmtime(os.path.join(root, file)))
+    return mtime
+
+
+def _is_fresh(parquet_path, source_path):
+    return os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= source_mtime(source_path)
+
+
+def _write_parquet(df, path):
+    """
+        Write a (Geo)DataFrame to parquet, ignoring failures.
+
+        The parquet copy only speeds up later loads, so a read-only or full
+        disk must not stop the dashboard from starting.
+        """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        df.to_parquet(path, compression=PARQUET_COMPRESSION)
+    except Exception as e:
+        logger.warning("Could not write parquet copy %s: %s", path, e)
+
+
+def _to_4326(gdf):
+    """
+        Reproject to EPSG:4326 unless the data is already in it.
+
+        Sources written in WGS84 (and the parquet copies of reprojected data)
+        skip the transform and the frame copy that to_crs always makes. Axis
+        order is ignored because geometries are always stored as (x, y).
+
+        Args:
+            gdf (GeoDataFrame): Data with a CRS set
+
+        Returns:
+            GeoDataFrame: Data in EPSG:4326
+        """
+    if gdf.crs is not None and gdf.crs.equals("EPSG:4326", ignore_axis_order=True):
+        return gdf
+    return gdf.to_crs("EPSG:4326")
+
+
+def _read_vector(path, name, columns, layer=None):
+    """
+        Read a vector layer in EPSG:4326, converting it to GeoParquet on first use.
+
+        The copy is stored already reprojected, so later loads neither re-parse
+        the shapefile or geodatabase through GDAL nor transform any coordinates.
+        It is rebuilt whenever the source is modified after it was written.
+
+        Args:
+            path (str): Source shapefile or geodatabase
+            name (str): Name of the parquet copy in PARQUET_CACHE_DIR
+            columns (list): Attribute columns to read
+            layer (str, optional): Layer name for multi-layer sources
+
+        Returns:
+            GeoDataFrame: Requested columns plus geometry in EPSG:4326
+        """
+    parquet_path = _parquet_path(name)
+    if _is_fresh(parquet_path, path):
+        try:
+            # A no-op unless the copy predates reprojection on write
+            return _to_4326(gpd.read_parquet(parquet_path, columns=[*columns, "geometry"]))
+        except Exception:
+            pass  # Unreadable copy; rebuild it from the source below
+    gdf = _to_4326(gpd.read_file(path, layer=layer, columns=columns, engine="pyogrio", use_arrow=True))
+    _write_parquet(gdf, parquet_path)
+    return gdf
+
+
+def _read_table(path, name, columns, **read_csv_kwargs):
+    """
+        Read a CSV file, converting it to parquet on first use.
+
+        The copy is rebuilt whenever the CSV is modified after it was written.
+
+        Args:
+            path (str): Source CSV file
+            name (str): Name of the parquet copy in PARQUET_CACHE_DIR
+            columns (list): Columns to read
+            **read_csv_kwargs: Extra arguments passed to pd.read_csv
+
+        Returns:
+            DataFrame: Requested columns
+        """
+    parquet_path = _parquet_path(name)
+    if _is_fresh(parquet_path, path):
+        try:
+            return pd.read_parquet(parquet_path, columns=columns)
+        except Exception:
+            pass  # Unreadable copy; rebuild it from the source below
+    df = pd.read_csv(path, usecols=columns, **read_csv_kwargs)
+    _write_parquet(df, parquet_path)
+    return df
+
+
+def _read_base_layer(path, simplified_path, name, columns):
+    """
+        Read a base map layer at display resolution.
+
+        Uses the simplified copy written by simplify_geometries.py when it
+        exists; otherwise the full-resolution geometries are simplified here
+        with the same tolerance, since base layers are only ever drawn at
+        state-wide zoom.
+
+        Args:
+            path (str): Full-resolution source
+            simplified_path (str): Output of simplify_geometries.py
+            name (str): Name of the parquet copy in PARQUET_CACHE_DIR
+            columns (list): Attribute columns to read
+
+        Returns:
+            GeoDataFrame: Requested columns plus simplified geometry in EPSG:4326
+        """
+    # Each source gets its own parquet copy; a shared name would let one be
+    # served in place of the other, since freshness is checked per source
+    if os.path.exists(simplified_path):
+        return _read_vector(simplified_path, f"{name}_simplified", columns)
+    gdf = _read_vector(path, name, columns)
+    gdf["geometry"] = shapely.simplify(gdf.geometry.values, SIMPLIFY_TOLERANCE_DEG, preserve_topology=True)
+    return gdf
+
+
+def _to_nullable_int(values, dtype):
+    """
+        Convert a column to a narrow nullable integer dtype.
+
+        Entries that are not numeric, not whole numbers, or outside the range
+        of dtype become missing instead of failing the cast, so one bad
+        record does not stop the whole dataset from loading.
+
+        Args:
+            values (Series): Raw column
+            dtype (str): Nullable integer dtype, e.g. "Int8"
+
+        Returns:
+            Series: values converted to dtype
+        """
+    numbers = pd.to_numeric(values, errors="coerce").astype("float64")
+    limits = np.iinfo(pd.api.types.pandas_dtype(dtype).numpy_dtype)
+    valid = numbers.between(limits.min, limits.max) & (numbers % 1 == 0)
+    return numbers.where(valid).astype(dtype)
+
+
+def _county_names(codes):
+    """
+        Convert fire county codes to a categorical of county names.
+
+        COUNTY_NUMBER_TO_NAME numbers the counties 1-36 in order, so each code
+        minus one is already the category code and no per-row lookup is needed.
+
+        Args:
+            codes (Series): Nullable integer county codes
+
+        Returns:
+            Categorical: County names with COUNTY_NAMES as categories; unknown codes are missing
+        """
+    category_codes = codes.to_numpy(dtype="int16", na_value=0) - 1
+    category_codes[(category_codes < 0) | (category_codes >= len(COUNTY_NAMES))] = -1
+    return pd.Categorical.from_codes(category_codes, categories=COUNTY_NAMES)
+
+
+def _set_year_summary(gdf, column):
+    """
+        Record year bounds and per-year counts of a loaded frame in gdf.attrs.
+
+        The summaries describe the full dataset, so the charts can be drawn
+        from them instead of regrouping every row on each rerun. pandas
+        deep-copies attrs into every derived frame and Series, so only plain
+        ints and dicts of ints are stored.
+
+        Args:
+            gdf (GeoDataFrame): Loaded data with a numeric year column
+            column (str): Name of the year column
+
+        Returns:
+            GeoDataFrame: The same frame with "year_counts" ({year: count} in year
+            order) and "year_rows" attrs set, plus "year_min" and "year_max" when
+            any row has a year
+        """
+    years = gdf[column].dropna().to_numpy(dtype="int64")
+    gdf.attrs["year_rows"] = len(gdf)
+    if len(years) == 0:
+        # No usable years (e.g. every date failed to parse); the data still loads
+        gdf.attrs["year_counts"] = {}
+        return gdf
+    year_min, year_max = int(years.min()), int(years.max())
+    # Years are small dense integers, so counting is one bincount pass that
+    # comes out already in year order
+    counts = np.bincount(years - year_min)
+    present = counts > 0
+    gdf.attrs["year_min"] = year_min
+    gdf.attrs["year_max"] = year_max
+    gdf.attrs["year_counts"] = dict(zip((np.flatnonzero(present) + year_min).tolist(),
+                                       counts[present].tolist()))
+    return gdf
+
+
+@st.cache_resource(show_spinner=False)
 def load_roads():
     """
         Load Oregon road data from shapefile.
 
+        Cached as a shared resource: the shapefile is parsed once per server
+        process and every session reuses the same read-only GeoDataFrame.
+        Geometries are simplified for display (see _read_base_layer).
+
         Returns:
             GeoDataFrame: Road geometries in EPSG:4326 projection, or None if error
         """
     try:
-        return gpd.read_file("data/tl_2019_41_prisecroads").to_crs("EPSG:4326")
+        return _read_base_layer(ROADS_PATH, ROADS_SIMPLIFIED_PATH, "roads", ROAD_COLUMNS)
     except FileNotFoundError:
         st.error("Road data file not found. Check that data/tl_2019_41_prisecroads exists.")
     except Exception as e:
         st.error(f"Error loading roads data: {e}")
 
 
-@st.cache_data
+@st.cache_resource(show_spinner=False)
 def load_counties():
     """
         Load Oregon county boundary data and filter to valid counties.
 
         Applies filtering to remove duplicate/invalid county entries based on ORIG_FID.
+        Cached as a shared resource like load_roads(); callers must not modify it.
+        Geometries are simplified for display (see _read_base_layer).
 
         Returns:
             GeoDataFrame: Filtered county boundaries in EPSG:4326 projection, or None if error
         """
     try:
-        gdf = gpd.read_file("data/BLM_OR_County_Boundaries_Polygon_Hub_-3504410327477223647")
-        gdf = gdf.to_crs("EPSG:4326")
+        gdf = _read_base_layer(COUNTIES_PATH, COUNTIES_SIMPLIFIED_PATH, "counties", COUNTY_COLUMNS)
 
         gdf["COUNTY_NAM"] = gdf["COUNTY_NAM"].str.upper()
 
@@ -105,7 +392,8 @@ def load_counties():
             (gdf["ORIG_FID"] > 37) & (gdf["COUNTY_NAM"].isin(["CLATSOP", "COLUMBIA"]))
         )
 
-        return gdf[mask]
+        # A categorical keeps one copy of each name and makes lookups integer-based
+        return gdf[mask].astype({"COUNTY_NAM": "category"})
     except FileNotFoundError:
         st.error("County boundaries data file not found. Please check the data directory.")
         return None
@@ -113,22 +401,45 @@ def load_counties():
         st.error(f"Error loading county data: {e}")
         return None
 
-@st.cache_data
+@st.cache_resource(show_spinner=False)
 def load_fire_data():
     """
        Load Oregon fire incident data from CSV and convert to GeoDataFrame.
 
        Processes longitude/latitude coordinates and creates Point geometries.
+       PreparedDate is parsed once here and a Year column is derived from it;
+       rows are sorted by Year so filter_by_year can slice them. Only the used
+       columns are read, with narrow dtypes for county codes and fire size.
+       County codes are mapped to a categorical CountyName column, and per-year
+       and per-county fire counts are stored in gdf.attrs (as plain dicts) for
+       the charts.
+       Cached as a shared resource like load_roads(); callers must not modify it.
 
        Returns:
            GeoDataFrame: Fire incidents with Point geometries in EPSG:4326, or None if error
        """
     try:
-        df = pd.read_csv("data/ODF_Fire_3681693300358663469.csv", dtype={"Longitude": str, "Latitude": str}, low_memory=False)
+        df = _read_table(FIRE_PATH, "fires", FIRE_COLUMNS,
+                         dtype={"Longitude": str, "Latitude": str, "FinalFireSizeAcres": MEASURE_DTYPE},
+                         low_memory=False)
         df["Longitude"] = pd.to_numeric(df["Longitude"], errors="coerce")
         df["Latitude"] = pd.to_numeric(df["Latitude"], errors="coerce")
         df = df.dropna(subset=["Longitude", "Latitude"])
-        return gpd.GeoDataFrame(df, geometry=[Point(xy) for xy in zip(df["Longitude"], df["Latitude"])], crs="EPSG:4326")
+        df["County"] = _to_nullable_int(df["County"], COUNTY_CODE_DTYPE)
+        df["PreparedDate"] = pd.to_datetime(df["PreparedDate"], format=FIRE_DATE_FORMAT, errors="coerce", cache=True)
+        df["Year"] = df["PreparedDate"].dt.year.astype(YEAR_DTYPE)
+        df = df.sort_values("Year", na_position="last", kind="stable").reset_index(drop=True)
+        geometry = gpd.points_from_xy(df["Longitude"].to_numpy(), df["Latitude"].to_numpy())
+        # The coordinates live on in the geometry, so the float columns are dropped
+        gdf = gpd.GeoDataFrame(df.drop(columns=["Longitude", "Latitude"]), geometry=geometry, crs="EPSG:4326")
+        gdf["CountyName"] = _county_names(gdf["County"])
+        # Category codes are 0-35 (-1 for unknown), so counting is one bincount
+        codes = gdf["CountyName"].cat.codes.to_numpy()
+        county_counts = np.bincount(codes[codes >= 0], minlength=len(COUNTY_NAMES))
+        # {name: count}, most fires first, as a plain dict so attrs stay cheap to copy
+        order = np.argsort(-county_counts, kind="stable")
+        gdf.attrs["county_counts"] = {COUNTY_NAMES[i]: int(county_counts[i]) for i in order if county_counts[i] > 0}
+        return _set_year_summary(gdf, "Year")
     except FileNotFoundError:
         st.error("Fire data file not found. Please check that 'data/ODF_Fire_3681693300358663469.csv' exists.")
         return None
@@ -137,17 +448,28 @@ def load_fire_data():
         return None
 
 
-@st.cache_data
+@st.cache_resource(show_spinner=False)
 def load_landslide_data():
     """
         Load Oregon landslide data from geodatabase.
 
+        The YEAR column is converted to numeric once here and rows are sorted by
+        it; VOLUME_ft3 is stored as float32.
+        Cached as a shared resource like load_roads(); callers must not modify it.
+
         Returns:
             GeoDataFrame: Historic landslide points in EPSG:4326, or None if error
         """
     try:
-        gdf = gpd.read_file("data/SLIDO_Release_4p5_wMetadata.gdb", layer="Historic_Landslide_Points")
-        return gdf.to_crs("EPSG:4326").dropna(subset=["geometry"])
+        gdf = _read_vector(LANDSLIDE_PATH, "landslides", LANDSLIDE_COLUMNS,
+                           layer="Historic_Landslide_Points")
+        gdf = gdf.dropna(subset=["geometry"])
+        # Fractional years are truncated as before; years outside Int16 become missing
+        years = pd.to_numeric(gdf["YEAR"], errors="coerce").astype("float64")
+        gdf["YEAR"] = _to_nullable_int(np.trunc(years), YEAR_DTYPE)
+        gdf["VOLUME_ft3"] = gdf["VOLUME_ft3"].astype(MEASURE_DTYPE)
+        gdf = gdf.sort_values("YEAR", na_position="last", kind="stable").reset_index(drop=True)
+        return _set_year_summary(gdf, "YEAR")
     except FileNotFoundError:
         st.error("Landslide data file not found. Please check that 'data/SLIDO_Release_4p5_wMetadata.gdb' exists.")
         return None
@@ -156,19 +478,31 @@ def load_landslide_data():
         return None
 
 
-@st.cache_data
+@st.cache_resource(show_spinner=False)
 def load_flood_data():
     """
         Load Oregon flood hazard data from geodatabase.
 
+        EFF_DATE is parsed once here and a Year column is derived from it;
+        rows are sorted by Year. ELEV is converted to float32 (missing if not
+        numeric) and its histogram is stored in gdf.attrs as plain tuples. Cached as a shared
+        resource like load_roads(); callers must not modify it.
+
         Returns:
             GeoDataFrame: FEMA Base Flood Elevation features in EPSG:4326, or None if error
         """
     try:
-        gdb_path = "data/Oregon_Statewide_Flood_Hazards.gdb"
-        layer_name = "FEMA_BFE"
-        gdf = gpd.read_file(gdb_path, layer=layer_name)
-        return gdf.to_crs("EPSG:4326").dropna(subset=["geometry"])
+        gdf = _read_vector(FLOOD_PATH, "floods", FLOOD_COLUMNS, layer="FEMA_BFE")
+        gdf = gdf.dropna(subset=["geometry"])
+        # OpenFileGDB date fields usually arrive typed already; only strings need parsing
+        if not pd.api.types.is_datetime64_any_dtype(gdf["EFF_DATE"]):
+            gdf["EFF_DATE"] = pd.to_datetime(gdf["EFF_DATE"], format="ISO8601", errors="coerce", cache=True)
+        gdf["Year"] = gdf["EFF_DATE"].dt.year.astype(YEAR_DTYPE)
+        gdf["ELEV"] = pd.to_numeric(gdf["ELEV"], errors="coerce").astype(MEASURE_DTYPE)
+        counts, edges = np.histogram(gdf["ELEV"].dropna().to_numpy(), bins=FLOOD_ELEVATION_BINS)
+        gdf.attrs["elevation_histogram"] = (tuple(counts.tolist()), tuple(edges.tolist()))
+        gdf = gdf.sort_values("Year", na_position="last", kind="stable").reset_index(drop=True)
+        return _set_year_summary(gdf, "Year")
     except FileNotFoundError:
         st.error("Flood data file not found. Please check that 'data/Oregon_Statewide_Flood_Hazards.gdb' exists.")
         return None
@@ -176,3 +510,59 @@ def load_flood_data():
         st.error(f"Error loading flood data: {e}")
         return None
 
+
+# =============================================================================
+# FILTERING FUNCTIONS
+# =============================================================================
+
+
+def filter_by_year(gdf, start_year, end_year, column="Year"):
+    """
+        Select rows whose year falls within an inclusive range.
+
+        The loaders return frames sorted by year (missing years last), so the
+        range is located with a binary search and returned as a positional
+        slice instead of building a boolean mask over every row. For a full
+        loaded frame the search runs over its per-year counts, so no per-row
+        work is done at all.
+
+        Args:
+            gdf (GeoDataFrame): Data sorted by the year column
+            start_year (int): First year to include
+            end_year (int): Last year to include
+            column (str): Name of the year column
+
+        Returns:
+            GeoDataFrame: Rows with start_year <= year <= end_year
+        """
+    counts = gdf.attrs.get("year_counts")
+    if counts is not None and gdf.attrs.get("year_rows") == len(gdf):
+        # Rows are grouped by year in the same order as year_counts
+        offsets = np.concatenate(([0], np.cumsum(list(counts.values()), dtype="int64")))
+        years = np.fromiter(counts, dtype="int64", count=len(counts))
+        lo = offsets[np.searchsorted(years, start_year, side="left")]
+        hi = offsets[np.searchsorted(years, end_year, side="right")]
+        return gdf.iloc[lo:hi]
+
+    # Missing years sort last, so map them to the largest int16 value
+    years = gdf[column].to_numpy(dtype="int16", na_value=np.iinfo(np.int16).max)
+    lo = np.searchsorted(years, start_year, side="left")
+    hi = np.searchsorted(years, end_year, side="right")
+    return gdf.iloc[lo:hi]
+
+
+def map_year_range(*gdfs):
+    """
+        Year range offered by the map slider for the given datasets.
+
+        Args:
+            *gdfs (GeoDataFrame): Frames returned by the loaders (uses their year attrs);
+                frames without any year are skipped
+
+        Returns:
+            tuple: (min_year, max_year), with min_year no earlier than MAP_MIN_YEAR
+        """
+    dated = [gdf for gdf in gdfs if "year_min" in gdf.attrs]
+    min_year = max(MAP_MIN_YEAR, min(gdf.attrs["year_min"] for gdf in dated))
+    max_year = max(gdf.attrs["year_max"] for gdf in dated)
+    return min_year, max_year
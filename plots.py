@@ -8,7 +8,8 @@ charts using matplotlib and geopandas.
 Key Components:
 - Map Visualizations:
   * Bubble maps (sized by fire/landslide severity)
-  * Dot maps (individual incident locations)
+  * Dot maps (individual incident locations, thinned to one point per grid cell)
+  * Point layers capped at MAP_MAX_POINTS by random subsampling
   * Uncertainty choropleth maps (county-level confidence ratings)
 
 - Statistical Charts:
@@ -18,22 +19,202 @@ Key Components:
 
 - Uncertainty Data:
   * Fire, landslide, and flood uncertainty dictionaries by county
-  * Classification function for uncertainty mapping
+  * Combined uncertainty table indexed by county name
+  * Cached annotation of county boundaries with uncertainty columns
+
+- Cached Map Rendering:
+  * PNG snapshots of the bubble, dot, and uncertainty maps keyed on widget state
+  * Pre-rendered snapshots from precompute_maps.py served from disk
 
 All visualizations use consistent styling and color schemes defined in data.py.
 """
 
+import io
+import os
+
 import pandas as pd
+import matplotlib as mpl
 import matplotlib.pyplot as plt
 import streamlit as st
 import numpy as np
 import matplotlib.ticker as ticker
+import matplotlib.colors as mcolors
+from matplotlib.collections import LineCollection
+import shapely
 import data as cfg
 
+# Simplify line paths below pixel resolution and stream long paths to Agg in
+# chunks; this trades sub-pixel fidelity on dense lines for faster renders
+mpl.rcParams.update({
+    "path.simplify": True,
+    "path.simplify_threshold": cfg.PATH_SIMPLIFY_THRESHOLD,
+    "agg.path.chunksize": cfg.AGG_PATH_CHUNKSIZE,
+})
+
 # =============================================================================
 # MAPPING FUNCTIONS
 # =============================================================================
 
+def thin_points(gdf, bounds=cfg.OREGON_BOUNDS, decimals=cfg.DOT_MAP_GRID_DECIMALS):
+    """
+        Cull points outside the map extent and keep one point per grid cell.
+
+        At state-level zoom many points land on the same pixel, so drawing only
+        one point per rounded (lon, lat) cell gives the same picture with far
+        fewer markers.
+
+        Args:
+            gdf (GeoDataFrame): Point data in EPSG:4326
+            bounds (tuple): (min lon, min lat, max lon, max lat) to keep
+            decimals (int): Decimal places used to bucket coordinates
+
+        Returns:
+            GeoDataFrame: Subset of gdf with at most one point per cell
+        """
+    x = shapely.get_x(gdf.geometry.values)
+    y = shapely.get_y(gdf.geometry.values)
+    inside = (x >= bounds[0]) & (x <= bounds[2]) & (y >= bounds[1]) & (y <= bounds[3])
+    cells = pd.DataFrame({"x": np.round(x[inside], decimals), "y": np.round(y[inside], decimals)})
+    return gdf[inside][~cells.duplicated().to_numpy()]
+
+
+def scatter_points(ax, gdf, **kwargs):
+    """
+        Draw a point layer as one rasterized scatter artist.
+
+        The coordinates are pulled out of the geometry array with vectorized
+        shapely calls and handed to ax.scatter, bypassing GeoDataFrame.plot.
+
+        Args:
+            ax (Axes): Axes to draw on
+            gdf (GeoDataFrame): Point data
+            **kwargs: Passed to ax.scatter (s, c, alpha, label, ...)
+        """
+    points = gdf.geometry.values
+    ax.scatter(shapely.get_x(points), shapely.get_y(points), rasterized=True, **kwargs)
+
+
+def line_segments(geometries):
+    """
+        Split line geometries into the vertex arrays a LineCollection takes.
+
+        Vertices are pulled out of the geometry array in a single vectorized
+        call and split into one (N, 2) array per part, instead of going
+        through GeoDataFrame.plot's per-feature path building.
+
+        Args:
+            geometries (GeoSeries): LineString/MultiLineString geometries
+
+        Returns:
+            list: One coordinate array per line part
+        """
+    parts = shapely.get_parts(np.asarray(geometries.values))
+    coords, index = shapely.get_coordinates(parts, return_index=True)
+    return np.split(coords, np.flatnonzero(np.diff(index)) + 1) if len(coords) else []
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_road_segments(_roads_gdf, source, mtime, rows):
+    return line_segments(_roads_gdf.geometry)
+
+
+def road_segments(roads_gdf):
+    """
+        Line segments of the road network, cached process-wide.
+
+        Every session and map that draws roads shares one segment list. The
+        frame itself is not hashed, so the cache is keyed on the road source
+        file load_roads() reads, its modification time and the row count;
+        pass the frame from load_roads(). Artists cannot be reused across
+        figures, so the segments are cached rather than the LineCollection.
+
+        Args:
+            roads_gdf (GeoDataFrame): Road network from load_roads()
+
+        Returns:
+            list: One coordinate array per road part
+        """
+    source = cfg.ROADS_SIMPLIFIED_PATH if os.path.exists(cfg.ROADS_SIMPLIFIED_PATH) else cfg.ROADS_PATH
+    return _cached_road_segments(roads_gdf, source, cfg.source_mtime(source), len(roads_gdf))
+
+
+def draw_segments(ax, segments, **kwargs):
+    """
+        Draw precomputed line segments as one LineCollection.
+
+        Args:
+            ax (Axes): Axes to draw on
+            segments (list): Coordinate arrays from line_segments
+            **kwargs: Passed to LineCollection (colors, linewidths, alpha, label, ...)
+        """
+    ax.add_collection(LineCollection(segments, **kwargs))
+    ax.autoscale_view()
+
+
+def draw_lines(ax, geometries, **kwargs):
+    """
+        Draw line or polygon-boundary geometries as one LineCollection.
+
+        Args:
+            ax (Axes): Axes to draw on
+            geometries (GeoSeries): LineString/MultiLineString geometries
+            **kwargs: Passed to LineCollection (colors, linewidths, alpha, label, ...)
+        """
+    draw_segments(ax, line_segments(geometries), **kwargs)
+
+
+def cap_points(gdf, max_points=cfg.MAP_MAX_POINTS):
+    """
+        Randomly subsample a point layer that has more than max_points rows.
+
+        Args:
+            gdf (GeoDataFrame): Point data
+            max_points (int): Largest number of rows to keep
+
+        Returns:
+            GeoDataFrame: gdf itself, or a reproducible sample of max_points rows
+        """
+    if len(gdf) <= max_points:
+        return gdf
+    return gdf.sample(max_points, random_state=0)
+
+
+def bubble_sizes(values, upper, scale):
+    """
+        Marker areas for a bubble layer: scale * log1p(min(value, upper)) ** 2.
+
+        Computed in place on one float32 array instead of allocating a new
+        Series for each step.
+
+        Args:
+            values (Series): Non-missing size values (acres or cubic feet)
+            upper (float): Values above this are clipped
+            scale (float): Multiplier applied to the squared log size
+
+        Returns:
+            ndarray: float32 marker sizes
+        """
+    sizes = values.to_numpy(dtype=np.float32, copy=True)
+    np.minimum(sizes, upper, out=sizes)
+    np.log1p(sizes, out=sizes)
+    np.square(sizes, out=sizes)
+    sizes *= scale
+    return sizes
+
+
+def set_lonlat_aspect(ax):
+    """
+        Give lon/lat axes the same aspect ratio GeoDataFrame.plot would.
+
+        Layers drawn with ax.scatter or draw_lines do not set an aspect, so this
+        keeps the maps from stretching when no GeoDataFrame layer is drawn.
+
+        Args:
+            ax (Axes): Axes holding EPSG:4326 data
+        """
+    ax.set_aspect(1 / np.cos(np.radians(np.mean(ax.get_ylim()))))
+
+
 def plot_bubble_map(fire_gdf, landslide_gdf, show_fire=True, show_landslide=True):
     """
        Create bubble map where bubble size represents fire size (acres) or landslide volume (cubic feet).
@@ -48,45 +229,28 @@ def plot_bubble_map(fire_gdf, landslide_gdf, show_fire=True, show_landslide=True
            Figure: Matplotlib figure object
        """
     try:
-        fig, ax = plt.subplots(figsize=(14, 14))
+        fig, ax = plt.subplots(figsize=(14, 14), layout="constrained")
         fig.patch.set_alpha(0.0)
         ax.set_facecolor((1, 1, 1, 1))
 
-        combined_bounds = None
-
         if show_fire:
-            # Filter fires with valid size data and minimum 10 acres
-            fire_bubble_gdf = fire_gdf.dropna(subset=["FinalFireSizeAcres"])
-            fire_bubble_gdf = fire_bubble_gdf[fire_bubble_gdf["FinalFireSizeAcres"] > 10]
-            fire_bubble_gdf["FinalFireSizeAcres"] = fire_bubble_gdf["FinalFireSizeAcres"].clip(upper=5000)
-            fire_sizes = (np.log1p(fire_bubble_gdf["FinalFireSizeAcres"])) ** 2 * 2.5
-            fire_bubble_gdf.plot(ax=ax, markersize=fire_sizes, color='firebrick', alpha=0.6, label="Fires")
-            combined_bounds = fire_bubble_gdf.total_bounds
+            # Keep fires of at least 10 acres; missing sizes compare False, so
+            # one mask also drops them
+            fire_bubble_gdf = cap_points(fire_gdf[(fire_gdf["FinalFireSizeAcres"] > 10).to_numpy()])
+            fire_sizes = bubble_sizes(fire_bubble_gdf["FinalFireSizeAcres"], 5000, 2.5)
+            scatter_points(ax, fire_bubble_gdf, s=fire_sizes, c='firebrick', alpha=0.6, label="Fires")
 
         if show_landslide:
-            # Filter landslides with valid volume data and minimum 1000 cubic feet
-            landslide_bubble_gdf = landslide_gdf.dropna(subset=["VOLUME_ft3"])
-            landslide_bubble_gdf = landslide_bubble_gdf[landslide_bubble_gdf["VOLUME_ft3"] > 1000]
-            landslide_bubble_gdf["VOLUME_ft3"] = landslide_bubble_gdf["VOLUME_ft3"].clip(upper=1_000_000)
-            landslide_sizes = (np.log1p(landslide_bubble_gdf["VOLUME_ft3"])) ** 2 * 0.8
-            landslide_bubble_gdf.plot(ax=ax, markersize=landslide_sizes, color='saddlebrown', alpha=0.6, label="Landslides")
-            # Update combined bounds to include both layers
-            bounds = landslide_bubble_gdf.total_bounds
-            if combined_bounds is not None:
-                combined_bounds = [
-                    min(combined_bounds[0], bounds[0]),
-                    min(combined_bounds[1], bounds[1]),
-                    max(combined_bounds[2], bounds[2]),
-                    max(combined_bounds[3], bounds[3]),
-                ]
-            else:
-                combined_bounds = bounds
-
+            # Keep landslides of at least 1000 cubic feet; missing volumes are
+            # dropped by the same mask
+            landslide_bubble_gdf = cap_points(landslide_gdf[(landslide_gdf["VOLUME_ft3"] > 1000).to_numpy()])
+            landslide_sizes = bubble_sizes(landslide_bubble_gdf["VOLUME_ft3"], 1_000_000, 0.8)
+            scatter_points(ax, landslide_bubble_gdf, s=landslide_sizes, c='saddlebrown', alpha=0.6, label="Landslides")
 
+        set_lonlat_aspect(ax)
         ax.set_title("Bubble Map of Oregon Fires and Landslides", color='white')
         ax.set_axis_off()
         plt.legend(loc='upper right')
-        plt.tight_layout()
         return fig
 
     except Exception as e:
@@ -116,27 +280,29 @@ def plot_dot_map(fire_gdf, landslide_gdf, flood_gdf=None, roads_gdf=None, counti
             Figure: Matplotlib figure object
         """
     try:
-        fig, ax = plt.subplots(figsize=(12, 12))
+        fig, ax = plt.subplots(figsize=(12, 12), layout="constrained")
         fig.patch.set_alpha(0.0)
         ax.set_facecolor((1, 1, 1, 1))
 
         if show_counties and counties_gdf is not None:
-            counties_gdf.boundary.plot(ax=ax, edgecolor="white", linewidth=0.8, alpha=0.6)
+            draw_lines(ax, counties_gdf.boundary, colors="white", linewidths=0.8, alpha=0.6)
         if show_roads and roads_gdf is not None:
-            roads_gdf.plot(ax=ax, color="gray", linewidth=0.4, alpha=0.6)
+            draw_segments(ax, road_segments(roads_gdf), colors="gray", linewidths=0.4, alpha=0.6)
 
         if show_landslides:
-            landslide_gdf.plot(ax=ax, color="saddlebrown", markersize=1, alpha=0.5, label="Landslides")
+            scatter_points(ax, cap_points(thin_points(landslide_gdf)),
+                           s=1, c="saddlebrown", alpha=0.5, label="Landslides")
         if show_fires:
-            fire_gdf.plot(ax=ax, color="firebrick", markersize=0.5, alpha=0.6, label="Fires")
+            scatter_points(ax, cap_points(thin_points(fire_gdf)),
+                           s=0.5, c="firebrick", alpha=0.6, label="Fires")
         if show_floods and flood_gdf is not None and not flood_gdf.empty:
-            flood_gdf.plot(ax=ax, color="royalblue", markersize=0.5, alpha=0.6, label="Flood Zones")
+            draw_lines(ax, flood_gdf.geometry, colors="royalblue", alpha=0.6, rasterized=True, label="Flood Zones")
 
+        set_lonlat_aspect(ax)
 
         ax.set_title("Oregon Fires, Landslides, and Floods", color='white')
         ax.set_axis_off()
         plt.legend(loc="upper right")
-        plt.tight_layout()
         return fig
 
     except Exception as e:
@@ -148,31 +314,42 @@ def plot_dot_map(fire_gdf, landslide_gdf, flood_gdf=None, roads_gdf=None, counti
 # PLOTTING FUNCTIONS
 # =============================================================================
 
+def show_figure(fig):
+    """
+        Display a figure in Streamlit and release it from pyplot.
+
+        Figures created with plt.subplots stay registered with pyplot until
+        closed, so every chart is closed right after it is sent to the page.
+
+        Args:
+            fig (Figure): Matplotlib figure object
+        """
+    st.pyplot(fig)
+    plt.close(fig)
+
+
 def plot_fires_by_year(fire_df):
     """
        Plot time series of fire incidents per year (1970 onwards).
 
        Args:
-           fire_df (DataFrame): Fire incident data with PreparedDate column
+           fire_df (DataFrame): Fire incident data from load_fire_data() (uses its "year_counts" attr)
 
        Returns:
            Figure: Matplotlib figure object
        """
     try:
-        fire_df["PreparedDate"] = pd.to_datetime(fire_df["PreparedDate"], errors="coerce")
-        fire_df["Year"] = fire_df["PreparedDate"].dt.year
-        counts = fire_df["Year"].value_counts().sort_index()
+        counts = pd.Series(fire_df.attrs["year_counts"])
 
         # Filter to 1970 onwards for cleaner visualization
         counts = counts[counts.index >= 1970]
 
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig, ax = plt.subplots(figsize=(12, 6), layout="constrained")
         ax.plot(counts.index, counts.values, marker='o', color='darkred')
         ax.set_title("Number of Fires per Year")
         ax.set_xlabel("Year")
         ax.set_ylabel("Fires")
         ax.grid(True)
-        plt.tight_layout()
         return fig
 
     except Exception as e:
@@ -180,38 +357,41 @@ def plot_fires_by_year(fire_df):
         return plt.figure()
 
 
+def plot_county_counts(county_counts, title, locator):
+    """
+        Draw a bar chart of fire counts per county and show it in Streamlit.
+
+        Args:
+            county_counts (Series): Fire counts indexed by county name
+            title (str): Chart title
+            locator (Locator): Major tick locator for the count axis
+        """
+    fig, ax = plt.subplots(figsize=(10, 6), layout="constrained")
+    county_counts.plot(kind='bar', color='darkred', ax=ax)
+    ax.set_title(title, fontsize=16)
+    ax.set_xlabel('County', fontsize=15)
+    ax.set_ylabel('Number of Fires', fontsize=15)
+    ax.yaxis.set_major_locator(locator)
+    ax.tick_params(axis='x', rotation=45)
+    show_figure(fig)
+
+
 def plot_fire_by_county(data):
     """
         Plot bar chart of top 10 counties most affected by fires.
 
         Args:
-            data (DataFrame): Fire incident data with County column (numeric codes)
+            data (DataFrame): Fire incident data from load_fire_data() (uses its "county_counts" attr)
         """
     try:
         if data is None or data.empty:
             st.warning(" No fire data available to plot.")
             return
 
-        county_number_to_name = cfg.COUNTY_NUMBER_TO_NAME
-
-        data = data.copy()
-
-        # Convert county codes to numeric and map to names
-        data["County"] = pd.to_numeric(data["County"], errors="coerce")
-        data["CountyName"] = data["County"].map(county_number_to_name)
-        # Get top 10 counties by fire count
-        county_counts = data['CountyName'].value_counts().head(10)
-
-        plt.figure(figsize=(10, 6))
-        ax = county_counts.plot(kind='bar', color='darkred')
-        plt.title('Top 10 Counties Most Affected by Fires', fontsize=16)
-        plt.xlabel('County', fontsize=15)
-        plt.ylabel('Number of Fires', fontsize=15)
-        ax.yaxis.set_major_locator(ticker.MultipleLocator(1000))
-        ax.tick_params(axis='x', rotation=45)
-        plt.tight_layout()
-        st.pyplot(plt.gcf())
-        plt.clf()
+        # county_counts is sorted by count, most fires first
+        plot_county_counts(pd.Series(data.attrs["county_counts"]).head(10),
+                           'Top 10 Counties Most Affected by Fires',
+                           ticker.MultipleLocator(1000))
 
     except Exception as e:
         st.error(f"Error plotting fire by county: {e}")
@@ -222,31 +402,16 @@ def plot_least_fire_by_county(data):
         Plot bar chart of top 10 counties least affected by fires.
 
         Args:
-            data (DataFrame): Fire incident data with County column (numeric codes)
+            data (DataFrame): Fire incident data from load_fire_data() (uses its "county_counts" attr)
         """
     try:
         if data is None or data.empty:
             st.warning("No fire data available to plot.")
             return
 
-
-        county_number_to_name = cfg.COUNTY_NUMBER_TO_NAME
-
-        data = data.copy()
-        data["County"] = pd.to_numeric(data["County"], errors="coerce")
-        data["CountyName"] = data["County"].map(county_number_to_name)
-        county_counts = data['CountyName'].value_counts().sort_values().head(10)
-
-        plt.figure(figsize=(10, 6))
-        ax = county_counts.plot(kind='bar', color='darkred')
-        plt.title('Top 10 Counties Least Affected by Fires', fontsize=16)
-        plt.xlabel('County', fontsize=15)
-        plt.ylabel('Number of Fires', fontsize=15)
-        ax.yaxis.set_major_locator(ticker.MaxNLocator(nbins='auto', integer=True))
-        ax.tick_params(axis='x', rotation=45)
-        plt.tight_layout()
-        st.pyplot(plt.gcf())
-        plt.clf()
+        plot_county_counts(pd.Series(data.attrs["county_counts"]).sort_values().head(10),
+                           'Top 10 Counties Least Affected by Fires',
+                           ticker.MaxNLocator(nbins='auto', integer=True))
 
     except Exception as e:
         st.error(f"Error plotting least affected counties: {e}")
@@ -259,26 +424,24 @@ def plot_landslides_by_year(landslide_df):
        Note: 1996 is excluded due to data quality issues in that year.
 
        Args:
-           landslide_df (DataFrame): Landslide incident data with YEAR column
+           landslide_df (DataFrame): Landslide data from load_landslide_data() (uses its "year_counts" attr)
 
        Returns:
            Figure: Matplotlib figure object
        """
     try:
-        landslide_df['YEAR'] = pd.to_numeric(landslide_df['YEAR'], errors='coerce')
+        counts = pd.Series(landslide_df.attrs["year_counts"])
         # Filter to 1965 onwards and exclude problematic 1996 data
-        landslide_df = landslide_df[(landslide_df['YEAR'] >= 1965) & (landslide_df['YEAR'] != 1996)]
-        counts = landslide_df['YEAR'].value_counts().sort_index()
+        counts = counts[(counts.index >= 1965) & (counts.index != 1996)]
         # Create continuous year range to show years with zero incidents
-        year_range = pd.Series(index=range(1965, int(landslide_df['YEAR'].max()) + 1), dtype=int).fillna(0)
-        counts = year_range.add(counts, fill_value=0)
-        fig, ax = plt.subplots(figsize=(12, 6))
+        if not counts.empty:
+            counts = counts.reindex(range(1965, int(counts.index.max()) + 1), fill_value=0)
+        fig, ax = plt.subplots(figsize=(12, 6), layout="constrained")
         ax.plot(counts.index, counts.values, marker='o', color='brown')
         ax.set_title("Number of Landslides per Year (excluding 1996)")
         ax.set_xlabel("Year")
         ax.set_ylabel("Landslides")
         ax.grid(True)
-        plt.tight_layout()
         return fig
 
     except Exception as e:
@@ -291,7 +454,7 @@ def plot_floods_by_year(flood_df):
         Plot time series of flood zone features per year.
 
         Args:
-            flood_df (DataFrame): Flood data with EFF_DATE column
+            flood_df (DataFrame): Flood data from load_flood_data() (uses its "year_counts" attr)
 
         Returns:
             Figure: Matplotlib figure object
@@ -301,19 +464,14 @@ def plot_floods_by_year(flood_df):
             st.warning("No flood data available to plot.")
             return plt.figure()
 
-        flood_df = flood_df.copy()
-        flood_df["EFF_DATE"] = pd.to_datetime(flood_df["EFF_DATE"], errors="coerce")
-        flood_df["Year"] = flood_df["EFF_DATE"].dt.year
-
-        counts = flood_df["Year"].value_counts().sort_index()
+        counts = pd.Series(flood_df.attrs["year_counts"])
 
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig, ax = plt.subplots(figsize=(12, 6), layout="constrained")
         ax.plot(counts.index, counts.values, marker='o', color='blue')
         ax.set_title("Number of Flood Features per Year")
         ax.set_xlabel("Year")
         ax.set_ylabel("Count")
         ax.grid(True)
-        plt.tight_layout()
         return fig
 
     except Exception as e:
@@ -326,7 +484,7 @@ def plot_flood_elevation_distribution(flood_df):
         Plot histogram of base flood elevations.
 
         Args:
-            flood_df (DataFrame): Flood data with ELEV column
+            flood_df (DataFrame): Flood data from load_flood_data() (uses its "elevation_histogram" attr)
 
         Returns:
             Figure: Matplotlib figure object
@@ -336,16 +494,13 @@ def plot_flood_elevation_distribution(flood_df):
             st.warning("No flood data available to plot.")
             return plt.figure()
 
-        flood_df = flood_df.copy()
-        flood_df = flood_df[pd.to_numeric(flood_df["ELEV"], errors="coerce").notnull()]
-        flood_df["ELEV"] = flood_df["ELEV"].astype(float)
+        counts, edges = flood_df.attrs["elevation_histogram"]
 
-        fig, ax = plt.subplots(figsize=(10, 6))
-        ax.hist(flood_df["ELEV"], bins=30, color='skyblue', edgecolor='black')
+        fig, ax = plt.subplots(figsize=(10, 6), layout="constrained")
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', color='skyblue', edgecolor='black')
         ax.set_title("Base Flood Elevation Distribution")
         ax.set_xlabel("Elevation (ft)")
         ax.set_ylabel("Count")
-        plt.tight_layout()
         return fig
 
     except Exception as e:
@@ -484,8 +639,65 @@ flood_uncertainty = {
 }
 
 
-def classify(county_name, mapping):
-    return mapping.get(county_name.upper(), "no data")
+# Ratings are stored as categorical codes: the UNCERTAINTY_COLORS levels in
+# order, then "no data"
+UNCERTAINTY_DTYPE = pd.CategoricalDtype([*cfg.UNCERTAINTY_COLORS, "no data"])
+
+# One row per county name, one column per hazard; counties missing from a
+# hazard's dictionary are rated "no data"
+UNCERTAINTY = pd.DataFrame({
+    "Fire_Uncertainty": fire_uncertainty,
+    "Landslide_Uncertainty": landslide_uncertainty,
+    "Flood_Uncertainty": flood_uncertainty,
+}).fillna("no data").astype(UNCERTAINTY_DTYPE)
+UNCERTAINTY_COLUMNS = tuple(UNCERTAINTY.columns)
+
+# RGBA fill per UNCERTAINTY_DTYPE code; the last row is the transparent
+# "no data" fill
+UNCERTAINTY_RGBA = np.array(
+    [mcolors.to_rgba(color, 0.6) for color in cfg.UNCERTAINTY_COLORS.values()] + [(0.0, 0.0, 0.0, 0.0)]
+)
+
+
+def uncertainty_rgba(ratings):
+    """
+       Convert a column of uncertainty ratings to an (n, 4) RGBA array.
+
+       Args:
+           ratings (Series): "high", "medium", "low" or "no data" per county
+
+       Returns:
+           ndarray: Fill colors, with "no data" fully transparent
+       """
+    # A no-op for columns from annotate_counties; unknown ratings get code -1,
+    # which also indexes the transparent last row
+    return UNCERTAINTY_RGBA[pd.Categorical(ratings, dtype=UNCERTAINTY_DTYPE).codes]
+
+
+@st.cache_data(show_spinner=False)
+def annotate_counties(_counties_gdf, columns=UNCERTAINTY_COLUMNS):
+    """
+       Add fire, landslide, and/or flood uncertainty columns to county boundaries.
+
+       The ratings are joined from the UNCERTAINTY table on the (upper-case)
+       county name in a single vectorized pass. The GeoDataFrame is not hashed
+       by Streamlit (GeoDataFrames are unhashable), so this must only be called
+       with the output of load_counties(); results are cached per set of columns.
+
+       Args:
+           _counties_gdf (GeoDataFrame): County boundaries with COUNTY_NAM column
+           columns (tuple): Names of the UNCERTAINTY_COLUMNS to compute
+
+       Returns:
+           GeoDataFrame: Copy of the counties with *_Uncertainty columns added, or None if no data
+       """
+    if _counties_gdf is None:
+        return None
+
+    columns = list(columns)
+    counties_gdf = _counties_gdf.join(UNCERTAINTY[columns], on="COUNTY_NAM")
+    counties_gdf[columns] = counties_gdf[columns].fillna("no data")
+    return counties_gdf
 
 
 def plot_uncertainty_map_layers(counties_gdf, roads_gdf=None,
@@ -515,62 +727,186 @@ def plot_uncertainty_map_layers(counties_gdf, roads_gdf=None,
             st.warning("No county data available to plot uncertainty map.")
             return plt.figure()
 
-        fig, ax = plt.subplots(figsize=(12, 12))
+        fig, ax = plt.subplots(figsize=(12, 12), layout="constrained")
         fig.patch.set_alpha(0.0)
         ax.set_facecolor((1, 1, 1, 1))
 
-        color_map = {
-            "high": "#006837",
-            "medium": "#fee08b",
-            "low": "#d73027",
-        }
-
-        if show_fire:
-            counties_gdf.plot(
-                ax=ax,
-                color=counties_gdf["Fire_Uncertainty"].map(color_map),
-                edgecolor="black",
-                linewidth=0.4,
-                alpha=0.6,
-                label="Fire Uncertainty"
-            )
-
-        if show_landslide:
-            counties_gdf.plot(
-                ax=ax,
-                color=counties_gdf["Landslide_Uncertainty"].map(color_map),
-                edgecolor="black",
-                linewidth=0.4,
-                alpha=0.6,
-                label="Landslide Uncertainty"
-            )
-
-        if show_flood:
-            counties_gdf.plot(
-                ax=ax,
-                color=counties_gdf["Flood_Uncertainty"].map(color_map),
-                edgecolor="black",
-                linewidth=0.4,
-                alpha=0.6,
-                label="Flood Uncertainty"
-            )
+        shown_columns = [
+            column for column, shown in zip(UNCERTAINTY_COLUMNS, (show_fire, show_landslide, show_flood))
+            if shown
+        ]
+        if shown_columns:
+            # Draw the polygons once; several selected hazards are blended. The
+            # fill carries its own 0.6 alpha, so the edges get it explicitly
+            fill = np.mean([uncertainty_rgba(counties_gdf[column]) for column in shown_columns], axis=0)
+            counties_gdf.plot(ax=ax, color=fill, edgecolor=(0, 0, 0, 0.6), linewidth=0.4)
 
         if show_roads and roads_gdf is not None:
-            roads_gdf.plot(ax=ax, color="gray", linewidth=0.4, alpha=0.6)
+            draw_segments(ax, road_segments(roads_gdf), colors="gray", linewidths=0.4, alpha=0.6)
 
         if show_counties:
-            counties_gdf.boundary.plot(ax=ax, edgecolor="white", linewidth=1, alpha=0.6)
+            draw_lines(ax, counties_gdf.boundary, colors="white", linewidths=1, alpha=0.6)
 
+        set_lonlat_aspect(ax)
 
-        for level, color in color_map.items():
+        for level, color in cfg.UNCERTAINTY_COLORS.items():
             ax.scatter([], [], color=color, label=f"{level.capitalize()} Confidence")
 
         ax.set_title("Uncertainty Map by County", color='white')
         ax.legend(loc="lower left")
         ax.set_axis_off()
-        plt.tight_layout()
         return fig
 
     except Exception as e:
         st.error(f"Error creating uncertainty map: {e}")
         return plt.figure()
+
+
+# =============================================================================
+# CACHED MAP RENDERING
+# =============================================================================
+# The map figures are expensive to draw, so each is rendered to PNG bytes and
+# cached per widget state. GeoDataFrame arguments are not hashed by Streamlit
+# (leading underscore); the year range and layer flags form the cache key, so
+# callers must pass the frames that were derived from those same values.
+# Snapshots baked by precompute_maps.py are served from disk when present and
+# newer than the map's source data, this module and data.py.
+# =============================================================================
+
+MAP_CACHE_ENTRIES = 16
+# st.pyplot's default resolution, so cached maps are as sharp as before
+MAP_DPI = 200
+
+# Source files behind each map; a snapshot older than any of them is ignored.
+# Base layers list both copies since either may be the one that was read.
+BASE_LAYER_SOURCES = (cfg.ROADS_PATH, cfg.ROADS_SIMPLIFIED_PATH, cfg.COUNTIES_PATH, cfg.COUNTIES_SIMPLIFIED_PATH)
+BUBBLE_MAP_SOURCES = (cfg.FIRE_PATH, cfg.LANDSLIDE_PATH)
+DOT_MAP_SOURCES = (*BUBBLE_MAP_SOURCES, cfg.FLOOD_PATH, *BASE_LAYER_SOURCES)
+UNCERTAINTY_MAP_SOURCES = BASE_LAYER_SOURCES
+
+
+def figure_to_png(fig, dpi=MAP_DPI):
+    """
+        Render a matplotlib figure to PNG bytes and close it.
+
+        Args:
+            fig (Figure): Matplotlib figure object
+            dpi (int): Output resolution
+
+        Returns:
+            bytes: PNG image data
+        """
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=dpi, bbox_inches="tight")
+    plt.close(fig)
+    return buf.getvalue()
+
+
+def map_snapshot_path(kind, flags, year_range=None):
+    """
+        File path of a pre-rendered map PNG for one widget state.
+
+        Args:
+            kind (str): "bubble", "dot", or "uncertainty"
+            flags (tuple): Layer visibility flags in the render function's argument order
+            year_range (tuple, optional): (start_year, end_year) for year-filtered maps
+
+        Returns:
+            str: Path under MAP_SNAPSHOT_DIR
+        """
+    bits = "".join("1" if flag else "0" for flag in flags)
+    years = f"_{year_range[0]}_{year_range[1]}" if year_range is not None else ""
+    return os.path.join(cfg.MAP_SNAPSHOT_DIR, f"{kind}{years}_{bits}.png")
+
+
+def _read_snapshot(path, sources):
+    """
+        Read a pre-rendered map PNG if it is still current.
+
+        A snapshot written before its source data or the plotting code last
+        changed would show stale maps, so it is ignored and the map is
+        rendered live until precompute_maps.py is run again.
+
+        Args:
+            path (str): Snapshot file from map_snapshot_path
+            sources (tuple): Source files the map is drawn from
+
+        Returns:
+            bytes: PNG image data, or None if missing or out of date
+        """
+    if not os.path.exists(path):
+        return None
+    # data.py holds the map constants and loader rules, so it counts as plotting code
+    newest_input = max(os.path.getmtime(__file__), os.path.getmtime(cfg.__file__),
+                       *(cfg.source_mtime(source) for source in sources))
+    if os.path.getmtime(path) < newest_input:
+        return None
+    with open(path, "rb") as f:
+        return f.read()
+
+
+@st.cache_data(max_entries=MAP_CACHE_ENTRIES, show_spinner=False)
+def render_bubble_map(_fire_gdf, _landslide_gdf, start_year, end_year, show_fire=True, show_landslide=True):
+    """
+        Cached PNG version of plot_bubble_map for one year range and layer selection.
+
+        Returns:
+            bytes: PNG image data
+        """
+    snapshot = _read_snapshot(map_snapshot_path("bubble", (show_fire, show_landslide), (start_year, end_year)),
+                              BUBBLE_MAP_SOURCES)
+    if snapshot is not None:
+        return snapshot
+    return figure_to_png(plot_bubble_map(_fire_gdf, _landslide_gdf, show_fire, show_landslide))
+
+
+@st.cache_data(max_entries=MAP_CACHE_ENTRIES, show_spinner=False)
+def render_dot_map(_fire_gdf, _landslide_gdf, _flood_gdf, _roads_gdf, _counties_gdf, start_year, end_year,
+                   show_fires=True, show_landslides=True, show_floods=True,
+                   show_roads=True, show_counties=True):
+    """
+        Cached PNG version of plot_dot_map for one year range and layer selection.
+
+        Returns:
+            bytes: PNG image data
+        """
+    flags = (show_fires, show_landslides, show_floods, show_roads, show_counties)
+    snapshot = _read_snapshot(map_snapshot_path("dot", flags, (start_year, end_year)), DOT_MAP_SOURCES)
+    if snapshot is not None:
+        return snapshot
+    return figure_to_png(plot_dot_map(
+        _fire_gdf,
+        _landslide_gdf,
+        flood_gdf=_flood_gdf,
+        roads_gdf=_roads_gdf,
+        counties_gdf=_counties_gdf,
+        show_fires=show_fires,
+        show_landslides=show_landslides,
+        show_floods=show_floods,
+        show_roads=show_roads,
+        show_counties=show_counties
+    ))
+
+
+@st.cache_data(max_entries=MAP_CACHE_ENTRIES, show_spinner=False)
+def render_uncertainty_map(_counties_gdf, _roads_gdf=None, show_roads=True, show_counties=True,
+                           show_fire=True, show_landslide=True, show_flood=False):
+    """
+        Cached PNG version of plot_uncertainty_map_layers for one layer selection.
+
+        Returns:
+            bytes: PNG image data
+        """
+    flags = (show_roads, show_counties, show_fire, show_landslide, show_flood)
+    snapshot = _read_snapshot(map_snapshot_path("uncertainty", flags), UNCERTAINTY_MAP_SOURCES)
+    if snapshot is not None:
+        return snapshot
+    return figure_to_png(plot_uncertainty_map_layers(
+        _counties_gdf,
+        roads_gdf=_roads_gdf,
+        show_roads=show_roads,
+        show_counties=show_counties,
+        show_fire=show_fire,
+        show_landslide=show_landslide,
+        show_flood=show_flood
+    ))
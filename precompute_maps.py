@@ -0,0 +1,95 @@
+"""
+precompute_maps.py - Map Snapshot Build Script
+
+Pre-renders the dashboard maps to PNG so the first view of each map is served
+from disk instead of being drawn with matplotlib on the request path.
+
+Rendered snapshots:
+- Dot map and bubble map for the full slider year range (the default view),
+  for every combination of layer checkboxes
+- Uncertainty map for every radio option
+
+Snapshots are written to MAP_SNAPSHOT_DIR (see data.py) using the file names
+from plots.map_snapshot_path(). Any other widget state is still rendered live.
+Snapshots older than their source data, plots.py or data.py are ignored by
+the dashboard, so re-run this script whenever any of them changes.
+
+Run with: python precompute_maps.py
+"""
+
+
+import itertools
+import os
+
+import data as cfg
+from data import load_fire_data, load_landslide_data, load_flood_data, load_roads, load_counties, filter_by_year, map_year_range
+from plots import (
+    plot_bubble_map,
+    plot_dot_map,
+    plot_uncertainty_map_layers,
+    annotate_counties,
+    figure_to_png,
+    map_snapshot_path,
+    UNCERTAINTY_COLUMNS,
+)
+
+
+def write_snapshot(path, fig):
+    with open(path, "wb") as f:
+        f.write(figure_to_png(fig))
+    print(f"Wrote {path}")
+
+
+def main():
+    os.makedirs(cfg.MAP_SNAPSHOT_DIR, exist_ok=True)
+
+    fire_gdf = load_fire_data()
+    landslide_gdf = load_landslide_data()
+    flood_gdf = load_flood_data()
+    roads_gdf = load_roads()
+    counties_gdf = load_counties()
+
+    year_range = map_year_range(fire_gdf, landslide_gdf, flood_gdf)
+    fire_gdf_year = filter_by_year(fire_gdf, *year_range)
+    landslide_gdf_year = filter_by_year(landslide_gdf, *year_range, column="YEAR")
+    flood_gdf_year = filter_by_year(flood_gdf, *year_range)
+
+    for flags in itertools.product([True, False], repeat=2):
+        path = map_snapshot_path("bubble", flags, year_range)
+        write_snapshot(path, plot_bubble_map(fire_gdf_year, landslide_gdf_year, *flags))
+
+    for flags in itertools.product([True, False], repeat=5):
+        show_fires, show_landslides, show_floods, show_roads, show_counties = flags
+        path = map_snapshot_path("dot", flags, year_range)
+        write_snapshot(path, plot_dot_map(
+            fire_gdf_year,
+            landslide_gdf_year,
+            flood_gdf=flood_gdf_year if show_floods else None,
+            roads_gdf=roads_gdf if show_roads else None,
+            counties_gdf=counties_gdf if show_counties else None,
+            show_fires=show_fires,
+            show_landslides=show_landslides,
+            show_floods=show_floods,
+            show_roads=show_roads,
+            show_counties=show_counties
+        ))
+
+    # Tab 2 always shows roads and counties with at most one uncertainty layer
+    annotated_gdf = annotate_counties(counties_gdf, UNCERTAINTY_COLUMNS)
+    for selected in [None, *UNCERTAINTY_COLUMNS]:
+        layer_flags = tuple(column == selected for column in UNCERTAINTY_COLUMNS)
+        flags = (True, True, *layer_flags)
+        path = map_snapshot_path("uncertainty", flags)
+        write_snapshot(path, plot_uncertainty_map_layers(
+            annotated_gdf,
+            roads_gdf=roads_gdf,
+            show_roads=True,
+            show_counties=True,
+            show_fire=layer_flags[0],
+            show_landslide=layer_flags[1],
+            show_flood=layer_flags[2]
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+simplify_geometries.py - One-time Base Layer Preprocessing Script
+
+Writes display-resolution copies of the road and county boundary shapefiles
+so the dashboard does not draw full-resolution geometry on every rerun.
+
+Steps for each layer:
+- Reproject to EPSG:4326 (WGS84)
+- Simplify geometries with topology preservation (SIMPLIFY_TOLERANCE_DEG)
+- Snap coordinates to a 5-decimal grid (COORDINATE_GRID_SIZE_DEG)
+
+The output paths are defined in data.py; load_roads() and load_counties()
+read the simplified files automatically when they exist.
+
+Run with: python simplify_geometries.py
+"""
+
+
+import geopandas as gpd
+import shapely
+
+import data as cfg
+
+
+def simplify_layer(gdf, tolerance=cfg.SIMPLIFY_TOLERANCE_DEG, grid_size=cfg.COORDINATE_GRID_SIZE_DEG):
+    """
+        Reduce vertex density and coordinate precision of a GeoDataFrame.
+
+        Args:
+            gdf (GeoDataFrame): Layer in EPSG:4326
+            tolerance (float): Simplification tolerance in degrees
+            grid_size (float): Coordinate precision grid in degrees
+
+        Returns:
+            GeoDataFrame: Copy of gdf with simplified geometries
+        """
+    gdf = gdf.copy()
+    simplified = shapely.simplify(gdf.geometry.values, tolerance, preserve_topology=True)
+    gdf["geometry"] = shapely.set_precision(simplified, grid_size)
+    return gdf[~gdf.geometry.is_empty]
+
+
+def main():
+    layers = [
+        (cfg.ROADS_PATH, cfg.ROADS_SIMPLIFIED_PATH),
+        (cfg.COUNTIES_PATH, cfg.COUNTIES_SIMPLIFIED_PATH),
+    ]
+    for src, dst in layers:
+        gdf = gpd.read_file(src, engine="pyogrio", use_arrow=True).to_crs("EPSG:4326")
+        simplified = simplify_layer(gdf)
+        simplified.to_file(dst, engine="pyogrio")
+
+        before = shapely.get_num_coordinates(gdf.geometry.values).sum()
+        after = shapely.get_num_coordinates(simplified.geometry.values).sum()
+        print(f"{src} -> {dst}: {before:,} -> {after:,} vertices")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Regression tests for the data loaders in data.py.
+
+Each test builds a small source file under a temporary working directory at
+the path the loader expects, so the real data/ and cache/ folders are never
+touched. Run with: python -m unittest discover tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+import geopandas as gpd
+import pandas as pd
+from shapely.geometry import LineString
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data
+
+
+class LoaderTestCase(unittest.TestCase):
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        os.makedirs("data")
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+
+class LoadFireDataTest(LoaderTestCase):
+    def setUp(self):
+        super().setUp()
+        data.load_fire_data.clear()
+
+    def test_invalid_county_codes_become_missing(self):
+        pd.DataFrame({
+            "Longitude": ["-123.0", "-122.0", "-121.0", "-120.0"],
+            "Latitude": ["44.0", "44.5", "45.0", "45.5"],
+            "PreparedDate": ["07/01/2000 12:00:00 PM"] * 4,
+            "County": ["1", "200", "3.5", "x"],
+            "FinalFireSizeAcres": [20.0, 30.0, 40.0, 50.0],
+        }).to_csv("data/ODF_Fire_3681693300358663469.csv", index=False)
+
+        gdf = data.load_fire_data()
+
+        self.assertIsNotNone(gdf)
+        self.assertEqual(len(gdf), 4)
+        self.assertEqual(gdf["County"].tolist()[0], 1)
+        self.assertTrue(gdf["County"].iloc[1:].isna().all())
+        self.assertEqual(gdf["CountyName"].iloc[0], data.COUNTY_NAMES[0])
+
+
+class LoadLandslideDataTest(LoaderTestCase):
+    def setUp(self):
+        super().setUp()
+        data.load_landslide_data.clear()
+
+    def test_fractional_and_out_of_range_years(self):
+        gpd.GeoDataFrame(
+            {"YEAR": [1990.0, 1996.5, 40000.0, None], "VOLUME_ft3": [1e4, 2e4, 3e4, 4e4]},
+            geometry=gpd.points_from_xy([-123.0, -122.0, -121.0, -120.0], [44.0, 44.5, 45.0, 45.5]),
+            crs="EPSG:4326",
+        ).to_file("data/SLIDO_Release_4p5_wMetadata.gdb", layer="Historic_Landslide_Points",
+                  driver="OpenFileGDB")
+
+        gdf = data.load_landslide_data()
+
+        self.assertIsNotNone(gdf)
+        self.assertEqual(len(gdf), 4)
+        self.assertEqual(gdf["YEAR"].dropna().tolist(), [1990, 1996])
+        self.assertEqual(gdf["YEAR"].isna().sum(), 2)
+
+
+
+class LoadFloodDataTest(LoaderTestCase):
+    def setUp(self):
+        super().setUp()
+        data.load_flood_data.clear()
+
+    def test_loads_without_any_parseable_date(self):
+        gpd.GeoDataFrame(
+            {"EFF_DATE": ["01/05/2010", None], "ELEV": [100.0, 200.0]},
+            geometry=[LineString([(-123.0, 44.0), (-122.9, 44.1)]), LineString([(-122.0, 45.0), (-121.9, 45.1)])],
+            crs="EPSG:4326",
+        ).to_file("data/Oregon_Statewide_Flood_Hazards.gdb", layer="FEMA_BFE", driver="OpenFileGDB")
+
+        gdf = data.load_flood_data()
+
+        self.assertIsNotNone(gdf)
+        self.assertEqual(len(gdf), 2)
+        self.assertEqual(gdf.attrs["year_counts"], {})
+        self.assertEqual(len(data.filter_by_year(gdf, 1900, 2100)), 0)
+
+        dated = gpd.GeoDataFrame({"Year": pd.array([2001, 2005], dtype=data.YEAR_DTYPE)},
+                                 geometry=gpd.points_from_xy([0, 0], [0, 0]))
+        data._set_year_summary(dated, "Year")
+        self.assertEqual(data.map_year_range(dated, gdf), (2001, 2005))
+
+
+class FilterByYearTest(unittest.TestCase):
+    RANGES = [(1990, 2010), (2000, 2000), (1980, 1985), (2030, 2040), (1900, 2100), (2001, 2003)]
+
+    def setUp(self):
+        years = pd.array([1995, 1995, 2000, 2003, 2003, 2003, 2010, None, None], dtype=data.YEAR_DTYPE)
+        self.gdf = gpd.GeoDataFrame({"Year": years}, geometry=gpd.points_from_xy(range(9), range(9)))
+        data._set_year_summary(self.gdf, "Year")
+
+    def assert_matches_mask(self, gdf):
+        for start, end in self.RANGES:
+            with self.subTest(start=start, end=end):
+                expected = gdf[((gdf["Year"] >= start) & (gdf["Year"] <= end)).fillna(False).to_numpy()]
+                result = data.filter_by_year(gdf, start, end)
+                self.assertEqual(result.index.tolist(), expected.index.tolist())
+
+    def test_year_counts_path(self):
+        self.assert_matches_mask(self.gdf)
+
+    def test_searchsorted_path(self):
+        # A slice no longer matches year_rows, so the column is searched instead
+        self.assert_matches_mask(self.gdf.iloc[1:])
+
+if __name__ == "__main__":
+    unittest.main()